@@ -7,7 +7,7 @@ cimport cython
 import numpy as np
 cimport numpy as np
 ctypedef cython.floating DTYPE_t
-from libc.math cimport log, exp, fabs
+from libc.math cimport log, log1p, exp, fabs
 from cython.parallel import prange
 
 
@@ -44,6 +44,10 @@ def mean_absolute_difference(a, b):
 cdef DTYPE_t _mean_absolute_difference(DTYPE_t[:] a, DTYPE_t[:] b) nogil:
     """Mean absolute difference between two arrays.
 
+    Accumulates into four partial sums, 4 elements per iteration: a single
+    accumulator serializes the loop on the floating-point add latency, while
+    independent partial sums let the compiler keep the loop vectorized.
+
     Parameters
     ----------
     a : numpy.ndarray
@@ -58,52 +62,88 @@ cdef DTYPE_t _mean_absolute_difference(DTYPE_t[:] a, DTYPE_t[:] b) nogil:
 
     """
 
-    cdef DTYPE_t result = 0.0
-    cdef size_t i
-    cdef size_t j
+    cdef DTYPE_t acc0 = 0.0
+    cdef DTYPE_t acc1 = 0.0
+    cdef DTYPE_t acc2 = 0.0
+    cdef DTYPE_t acc3 = 0.0
+    cdef DTYPE_t result
+    cdef size_t i = 0
 
     cdef size_t I = a.shape[0]
     cdef size_t N = I
-
-    for i in range(I):
-        result += fabs(a[i] - b[i])
+    cdef size_t I4 = I - (I % 4)
+
+    while i < I4:
+        acc0 += fabs(a[i] - b[i])
+        acc1 += fabs(a[i + 1] - b[i + 1])
+        acc2 += fabs(a[i + 2] - b[i + 2])
+        acc3 += fabs(a[i + 3] - b[i + 3])
+        i += 4
+    for i in range(I4, I):
+        acc0 += fabs(a[i] - b[i])
+
+    result = (acc0 + acc1) + (acc2 + acc3)
     result /= N
 
     return result
 
 
-def logsumexp(x):
+def logsumexp(x, axis=None):
     """Log of sum of exponentials, using :func:`~gensim._matutils._logsumexp_2d`.
 
     Parameters
     ----------
     x : numpy.ndarray
         Input 2d matrix, supports float16, float32 and float64.
+        With `axis`, arrays of any dimensionality are accepted.
+    axis : {int, tuple of int}, optional
+        Axis or axes to reduce over. If given, one reduction per remaining
+        axis is performed in a single vectorized sweep, instead of one Python
+        call per sub-array.
 
     Returns
     -------
-    float
-        log of sum of exponentials of elements in `x`.
+    {float, numpy.ndarray}
+        log of sum of exponentials of elements in `x`; an array when `axis` is given.
 
     Warnings
     --------
-    By performance reasons, doesn't support NaNs or 1d, 3d, etc arrays like :func:`scipy.special.logsumexp`.
+    By performance reasons, doesn't support NaNs like :func:`scipy.special.logsumexp`.
+    Without `axis`, only 2d arrays are supported.
 
     """
+    if axis is not None:
+        x_max = np.max(x, axis=axis, keepdims=True)
+        return np.log(np.sum(np.exp(x - x_max), axis=axis)) + np.squeeze(x_max, axis=axis)
+
+    if x.size == 2:
+        # binary case: log(exp(a) + exp(b)) = max(a, b) + log1p(exp(-|a - b|)),
+        # which spends one exp instead of two and stays accurate via log1p
+        a, b = x.ravel()
+        return max(a, b) + log1p(exp(-fabs(a - b)))
 
     if x.dtype == np.float64:
         return _logsumexp_2d[double](x)
     elif x.dtype == np.float32:
         return _logsumexp_2d[float](x)
     elif x.dtype == np.float16:
-        return _logsumexp_2d[float](x.astype(np.float32))
+        # keep the shift in float16 itself: the exp arguments then lie in
+        # [log(tiny), 0], where float16 cannot overflow, and the input is
+        # never copied up to float32
+        x_max = x.max()
+        return float(np.log(np.sum(np.exp(x - x_max))) + x_max)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
 cdef DTYPE_t _logsumexp_2d(DTYPE_t[:, :] data) nogil:
-    """Log of sum of exponentials.
+    """Log of sum of exponentials, in a single pass over `data`.
+
+    Keeps a running maximum `max_val` and a running sum of exponentials shifted
+    by it; whenever a new maximum appears, the accumulated sum is rescaled by
+    `exp(old_max - new_max)`. This streams `data` once instead of twice and
+    needs no temporary array for the shifted exponentials.
 
     Parameters
     ----------
@@ -119,6 +159,7 @@ cdef DTYPE_t _logsumexp_2d(DTYPE_t[:, :] data) nogil:
 
     cdef DTYPE_t max_val = data[0, 0]
     cdef DTYPE_t result = 0.0
+    cdef DTYPE_t val
     cdef size_t i
     cdef size_t j
 
@@ -127,12 +168,12 @@ cdef DTYPE_t _logsumexp_2d(DTYPE_t[:, :] data) nogil:
 
     for i in range(I):
         for j in range(J):
-            if data[i, j] > max_val:
-                max_val = data[i, j]
-
-    for i in range(I):
-        for j in range(J):
-            result += exp(data[i, j] - max_val)
+            val = data[i, j]
+            if val > max_val:
+                result = result * exp(max_val - val) + 1.0
+                max_val = val
+            else:
+                result += exp(val - max_val)
 
     result = log(result) + max_val
 
@@ -178,13 +219,13 @@ def dirichlet_expectation_2d(alpha):
 
     """
     if alpha.dtype == np.float64:
-        out = np.zeros(alpha.shape, dtype=alpha.dtype)
+        out = np.empty(alpha.shape, dtype=alpha.dtype)  # every element is overwritten below
         _dirichlet_expectation_2d[double](alpha, out)
     elif alpha.dtype == np.float32:
-        out = np.zeros(alpha.shape, dtype=alpha.dtype)
+        out = np.empty(alpha.shape, dtype=alpha.dtype)  # every element is overwritten below
         _dirichlet_expectation_2d[float](alpha, out)
     elif alpha.dtype == np.float16:
-        out = np.zeros(alpha.shape, dtype=np.float32)
+        out = np.empty(alpha.shape, dtype=np.float32)
         _dirichlet_expectation_2d[float](alpha.astype(np.float32), out)
         out = out.astype(np.float16)
 
@@ -207,13 +248,13 @@ def dirichlet_expectation_1d(alpha):
 
     """
     if alpha.dtype == np.float64:
-        out = np.zeros(alpha.shape, dtype=alpha.dtype)
+        out = np.empty(alpha.shape, dtype=alpha.dtype)  # every element is overwritten below
         _dirichlet_expectation_1d[double](alpha, out)
     elif alpha.dtype == np.float32:
-        out = np.zeros(alpha.shape, dtype=alpha.dtype)
+        out = np.empty(alpha.shape, dtype=alpha.dtype)  # every element is overwritten below
         _dirichlet_expectation_1d[float](alpha, out)
     elif alpha.dtype == np.float16:
-        out = np.zeros(alpha.shape, dtype=np.float32)
+        out = np.empty(alpha.shape, dtype=np.float32)
         _dirichlet_expectation_1d[float](alpha.astype(np.float32), out)
         out = out.astype(np.float16)
 
@@ -279,6 +320,36 @@ cdef void _dirichlet_expectation_2d(DTYPE_t[:, :] alpha, DTYPE_t[:, :] out) nogi
             out[i, j] = _digamma(alpha[i, j]) - psi_sum_alpha
 
 
+def sparse2full_small(doc, length):
+    """Convert a short document in BoW format into a dense float32 array.
+
+    Fast path for :func:`~gensim.matutils.sparse2full` on small `length`
+    (typically topic vectors), writing each pair straight into a typed
+    buffer instead of building an intermediate dict.
+
+    Parameters
+    ----------
+    doc : list of (int, number)
+        Document in BoW format.
+    length : int
+        Vector dimensionality.
+
+    Returns
+    -------
+    numpy.ndarray
+        Dense numpy vector for `doc`.
+
+    """
+    cdef np.float32_t[::1] out = np.zeros(length, dtype=np.float32)
+    cdef Py_ssize_t idx
+
+    for id_, val_ in doc:
+        idx = int(id_)  # ids may arrive as numpy or even float scalars
+        out[idx] = val_
+
+    return np.asarray(out)
+
+
 def digamma(DTYPE_t x):
     """Digamma function for positive floats, using :func:`~gensim._matutils._digamma`.
 
@@ -389,6 +389,11 @@ def sparse2full(doc, length):
         Convert dense array to gensim bag-of-words format.
 
     """
+    if length < 128 and _sparse2full_small is not None:
+        # short vectors (typically topics): write pairs straight into a typed
+        # buffer in the compiled extension, skipping the dict round-trip below
+        return _sparse2full_small(doc, length)
+
     result = np.zeros(length, dtype=np.float32)  # fill with zeroes (default value)
     # convert indices to int as numpy 1.12 no longer indexes by floats
     doc = ((int(id_), float(val_)) for (id_, val_) in doc)
@@ -619,6 +624,33 @@ class Sparse2Corpus:
             inow = self.sparse.indptr[key + 1]
             return list(zip(sparse.indices[iprev:inow], sparse.data[iprev:inow]))
 
+        if isinstance(key, (list, range, np.ndarray)) and getattr(key, 'ndim', 1) == 1:
+            cols = np.asarray(key)
+        else:
+            cols = None
+
+        if cols is not None and (cols.dtype.kind in 'iu' or cols.size == 0):
+            # gather the requested columns straight from the CSC arrays: two
+            # vectorized takes, instead of scipy's per-column fancy indexing;
+            # boolean masks and other exotic keys fall through to scipy below
+            cols = cols.astype(np.intp)
+            cols[cols < 0] += sparse.shape[1]
+            if np.any(cols < 0) or np.any(cols >= sparse.shape[1]):
+                # match scipy's fancy-indexing contract instead of silently
+                # wrapping around or reading a neighbouring indptr slot
+                raise IndexError("column index out of range for matrix with %i columns" % sparse.shape[1])
+            starts = sparse.indptr[cols]
+            lens = sparse.indptr[cols + 1] - starts
+            out_indptr = np.empty(len(cols) + 1, dtype=np.intp)
+            out_indptr[0] = 0
+            np.cumsum(lens, out=out_indptr[1:])
+            take = np.repeat(starts - out_indptr[:-1], lens) + np.arange(out_indptr[-1], dtype=np.intp)
+            gathered = scipy.sparse.csc_matrix(
+                (sparse.data.take(take), sparse.indices.take(take), out_indptr),
+                shape=(sparse.shape[0], len(cols)),
+            )
+            return Sparse2Corpus(gathered)
+
         sparse = self.sparse.__getitem__((slice(None, None, None), key))
         return Sparse2Corpus(sparse)
 
@@ -692,6 +724,10 @@ def ret_log_normalize_vec(vec, axis=1):
 blas_nrm2 = blas('nrm2', np.array([], dtype=float))
 blas_scal = blas('scal', np.array([], dtype=float))
 
+# single-precision variants, to avoid a float64 round-trip copy on float32 input
+blas_nrm2_single = blas('nrm2', np.array([], dtype=np.float32))
+blas_scal_single = blas('scal', np.array([], dtype=np.float32))
+
 
 def unitvec(vec, norm='l2', return_norm=False):
     """Scale a vector to unit length.
@@ -726,13 +762,17 @@ def unitvec(vec, norm='l2', return_norm=False):
         if norm == 'l1':
             veclen = np.sum(np.abs(vec.data))
         if norm == 'l2':
-            veclen = np.sqrt(np.sum(vec.data ** 2))
+            veclen = np.sqrt(np.dot(vec.data, vec.data))  # one BLAS dot, no squared temporary
         if norm == 'unique':
             veclen = vec.nnz
         if veclen > 0.0:
             if np.issubdtype(vec.dtype, np.integer):
                 vec = vec.astype(float)
-            vec /= veclen
+            else:
+                vec = vec.copy()
+            # scale the copy's data in place instead of building a whole new
+            # sparse matrix via `vec / veclen`
+            vec.data /= veclen
             if return_norm:
                 return vec, veclen
             else:
@@ -744,22 +784,33 @@ def unitvec(vec, norm='l2', return_norm=False):
                 return vec
 
     if isinstance(vec, np.ndarray):
+        # use BLAS routines matching the input precision: the float64 variants
+        # would silently copy & upcast a float32 vector on every call
+        if vec.dtype == np.float32:
+            nrm2, scal = blas_nrm2_single, blas_scal_single
+        else:
+            nrm2, scal = blas_nrm2, blas_scal
         if norm == 'l1':
             veclen = np.sum(np.abs(vec))
         if norm == 'l2':
             if vec.size == 0:
                 veclen = 0.0
             else:
-                veclen = blas_nrm2(vec)
+                veclen = nrm2(vec)
         if norm == 'unique':
             veclen = np.count_nonzero(vec)
         if veclen > 0.0:
             if np.issubdtype(vec.dtype, np.integer):
                 vec = vec.astype(float)
+            elif vec.dtype == np.float32:
+                # sscal scales in place when the dtype matches; scale a copy so
+                # the caller's array stays untouched (still cheaper than the
+                # float64 round trip dscal would make)
+                vec = vec.copy()
             if return_norm:
-                return blas_scal(1.0 / veclen, vec).astype(vec.dtype), veclen
+                return scal(1.0 / veclen, vec).astype(vec.dtype), veclen
             else:
-                return blas_scal(1.0 / veclen, vec).astype(vec.dtype)
+                return scal(1.0 / veclen, vec).astype(vec.dtype)
         else:
             if return_norm:
                 return vec, 1.0
@@ -1029,26 +1080,41 @@ def jaccard_distance(set1, set2):
 try:
     # try to load fast, cythonized code if possible
     from gensim._matutils import logsumexp, mean_absolute_difference, dirichlet_expectation
+    from gensim._matutils import sparse2full_small as _sparse2full_small
 
 except ImportError:
-    def logsumexp(x):
+    _sparse2full_small = None
+
+    def logsumexp(x, axis=None):
         """Log of sum of exponentials.
 
         Parameters
         ----------
         x : numpy.ndarray
-            Input 2d matrix.
+            Input 2d matrix. With `axis`, arrays of any dimensionality are accepted.
+        axis : {int, tuple of int}, optional
+            Axis or axes to reduce over, vectorizing the reduction over the remaining axes.
 
         Returns
         -------
-        float
-            log of sum of exponentials of elements in `x`.
+        {float, numpy.ndarray}
+            log of sum of exponentials of elements in `x`; an array when `axis` is given.
 
         Warnings
         --------
-        For performance reasons, doesn't support NaNs or 1d, 3d, etc arrays like :func:`scipy.special.logsumexp`.
+        For performance reasons, doesn't support NaNs like :func:`scipy.special.logsumexp`.
 
         """
+        if axis is not None:
+            x_max = np.max(x, axis=axis, keepdims=True)
+            return np.log(np.sum(np.exp(x - x_max), axis=axis)) + np.squeeze(x_max, axis=axis)
+
+        if x.size == 2:
+            # binary case: log(exp(a) + exp(b)) = max(a, b) + log1p(exp(-|a - b|)),
+            # which spends one exp instead of two and stays accurate via log1p
+            a, b = x.ravel()
+            return max(a, b) + math.log1p(math.exp(-abs(a - b)))
+
         x_max = np.max(x)
         x = np.log(np.sum(np.exp(x - x_max)))
         x += x_max
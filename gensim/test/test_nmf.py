@@ -12,6 +12,7 @@ import unittest
 import copy
 import logging
 import numbers
+from itertools import chain, repeat
 
 import numpy as np
 
@@ -22,8 +23,11 @@ from gensim.test.utils import datapath, get_tmpfile, common_corpus, common_dicti
 
 
 class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
-    def setUp(self):
-        self.model = nmf.Nmf(
+    @classmethod
+    def setUpClass(cls):
+        # train the reference model only once: it is identical for every test
+        # method, and the 100-pass training loop dominates the suite's runtime
+        cls._base_model = nmf.Nmf(
             common_corpus,
             id2word=common_dictionary,
             chunksize=1,
@@ -31,10 +35,21 @@ class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
             passes=100,
             random_state=42,
         )
+        # serialized once here, with large arrays stored separately (plain and
+        # compressed), for the mmap loading tests below
+        cls._mmap_fname = get_tmpfile('gensim_models_nmf_mmap.tst')
+        cls._base_model.save(cls._mmap_fname, sep_limit=0)
+        cls._mmap_fname_gz = get_tmpfile('gensim_models_nmf_mmap.tst.gz')
+        cls._base_model.save(cls._mmap_fname_gz, sep_limit=0)
+
+    def setUp(self):
+        self.model = copy.deepcopy(self._base_model)
 
     def test_generator(self):
+        # a one-shot iterator corpus must train the same model as the
+        # equivalent materialized list
         model_1 = nmf.Nmf(
-            iter(common_corpus * 100),
+            chain.from_iterable(repeat(common_corpus, 100)),
             id2word=common_dictionary,
             chunksize=1,
             num_topics=2,
@@ -60,14 +75,8 @@ class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
         self.assertFalse(np.allclose(self.model.get_topics(), model.get_topics()))
 
     def test_random_state(self):
-        model_1 = nmf.Nmf(
-            common_corpus,
-            id2word=common_dictionary,
-            chunksize=1,
-            num_topics=2,
-            passes=100,
-            random_state=42,
-        )
+        # same seed as the cached reference model, so reuse it instead of retraining
+        model_1 = self._base_model
         model_2 = nmf.Nmf(
             common_corpus,
             id2word=common_dictionary,
@@ -92,7 +101,7 @@ class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
         print("vec results", vec)
 
         # must contain the same values, up to re-ordering
-        self.assertTrue(np.allclose(sorted(vec), sorted(expected), atol=1e-3))
+        self.assertTrue(np.allclose(np.sort(vec), np.sort(expected), atol=1e-3))
 
         # transform one word
         word = 5
@@ -103,7 +112,7 @@ class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
         print("vec2 ", vec)
 
         # must contain the same values, up to re-ordering
-        self.assertTrue(np.allclose(sorted(vec), sorted(expected), atol=1e-3))
+        self.assertTrue(np.allclose(np.sort(vec), np.sort(expected), atol=1e-3))
 
     def test_top_topics(self):
         top_topics = self.model.top_topics(common_corpus)
@@ -165,25 +174,17 @@ class TestNmf(unittest.TestCase, basetmtests.TestBaseTopicModel):
         self.assertTrue(np.allclose(self.model[tstvec], model2[tstvec]))  # try projecting an empty vector
 
     def test_large_mmap(self):
-        fname = get_tmpfile('gensim_models_nmf.tst')
-
-        # simulate storing large arrays separately
-        self.model.save(fname, sep_limit=0)
-
-        # test loading the large model arrays with mmap
-        model2 = nmf.Nmf.load(fname, mmap='r')
+        # test loading the large model arrays with mmap, from the copy
+        # serialized with sep_limit=0 in setUpClass
+        model2 = nmf.Nmf.load(self._mmap_fname, mmap='r')
         self.assertEqual(self.model.num_topics, model2.num_topics)
         tstvec = []
         self.assertTrue(np.allclose(self.model[tstvec], model2[tstvec]))  # try projecting an empty vector
 
     def test_large_mmap_compressed(self):
-        fname = get_tmpfile('gensim_models_nmf.tst.gz')
-
-        # simulate storing large arrays separately
-        self.model.save(fname, sep_limit=0)
-
-        # test loading the large model arrays with mmap
-        self.assertRaises(IOError, nmf.Nmf.load, fname, mmap='r')
+        # loading a genuinely compressed model with mmap must fail; the .gz
+        # copy was serialized once in setUpClass
+        self.assertRaises(IOError, nmf.Nmf.load, self._mmap_fname_gz, mmap='r')
 
     def test_dtype_backward_compatibility(self):
         nmf_fname = datapath('nmf_model')